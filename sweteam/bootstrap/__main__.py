@@ -9,70 +9,178 @@ Usage:
 
 """
 import contextlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import json
+try:
+    # orjson parses a contiguous byte buffer in native code, a few times
+    # faster than the stdlib; fall back silently when not installed
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 import os
 import sys
 import shutil
 import subprocess
+import tomllib
 import yaml
+try:
+    # libyaml-backed parser, much faster than the pure-Python SafeLoader
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
 
 from . import utils, logging, logger
 from .config import config
 from .defs import AgentFactory, BaseAgent
 from .utils.log import logging_context
 
+# path constants resolved once at import instead of per call
+_MODULE_DIR = os.path.dirname(os.path.realpath(__file__))
+_PARENT_DIR = os.path.dirname(_MODULE_DIR)
+_AGENTS_DIR = os.path.join(_MODULE_DIR, 'agents')
+
 
 def load_agents():
     from .orchestrator import OllamaOrchestrator as Orchestrator
     orchestrator: Orchestrator
     if __package__ and __package__.endswith("bootstrap"):
         print(f"Warning, Current package name: {__package__}")
-    agents_dir = os.path.join(os.path.dirname(__file__), 'agents')
+    agents_dir = _AGENTS_DIR
     logger.debug(f"package name: {__package__}")
-    agents_list = [entry.removesuffix(".json") for entry in os.listdir(
-        agents_dir) if entry.endswith(".json")]
+    # group each agent's .json config and .feedback.yaml in one scandir pass
+    agent_files: dict[str, dict] = {}
+    with os.scandir(agents_dir) as dir_entries:
+        for entry in dir_entries:
+            if not entry.is_file():
+                continue
+            if entry.name.endswith(".feedback.yaml"):
+                agent_files.setdefault(entry.name.removesuffix(
+                    ".feedback.yaml"), {})["feedback"] = entry.path
+            elif entry.name.endswith(".json"):
+                agent_files.setdefault(entry.name.removesuffix(
+                    ".json"), {})["config"] = entry.path
     with Orchestrator() as orchestrator:
         with contextlib.ExitStack() as stack:
-            for agt in agents_list:
+            for agt, agt_files in agent_files.items():
+                if "config" not in agt_files:
+                    continue
                 agt_cfg: BaseAgent.AgentConfig
                 try:
-                    agt_cfg = BaseAgent.AgentConfig(json.load(
-                        open(os.path.join(agents_dir, agt + ".json"))))
+                    with open(agt_files["config"], "rb") as cfg_file:
+                        agt_cfg = BaseAgent.AgentConfig(
+                            _json_loads(cfg_file.read()))
                     logger.debug("loaded agent %s: %s", agt, agt_cfg)
                 except Exception as e:
                     logger.error(
                         "Error loading agent config %s: %s", agt, e, exc_info=e)
                     continue
 
-                try:
-                    agt_feedback = yaml.safe_load(
-                        open(os.path.join(agents_dir, agt+".feedback.yaml")))
-                    logger.debug("loaded agent %s feedback: %s",
-                                 agt, agt_feedback)
-                except Exception as e:
-                    logger.error(
-                        "Error loading agent feedback %s: %s", agt, e, exc_info=e)
+                if "feedback" in agt_files:
+                    try:
+                        with open(agt_files["feedback"]) as fb_file:
+                            agt_feedback = yaml.load(
+                                fb_file, Loader=_YamlSafeLoader)
+                        logger.debug("loaded agent %s feedback: %s",
+                                     agt, agt_feedback)
+                    except Exception as e:
+                        logger.error(
+                            "Error loading agent feedback %s: %s", agt, e, exc_info=e)
+                        agt_feedback = None
+                else:
+                    # agents without feedback are the common case; skip the
+                    # open() instead of paying for a FileNotFoundError each
                     agt_feedback = None
                 stack.enter_context(AgentFactory.create(
                     agent_config=agt_cfg, previous_feedback=agt_feedback))
 
             prompt = "Not Empty"
             round = 0
-            while prompt and (round := round + 1) < 5:
-                open_issues = orchestrator.follow_up()
-                if open_issues:
-                    print(f"There are still open issues:{open_issues!r}")
-                else:
-                    print(f"No more open issues.")
-                prompt += input(
-                    "\n***What would you like the team to tackle next? (to exit, just press enter)\n:")
-                round += 1
-                response = orchestrator.perform_task(prompt, f"User Interaction #{round}")
+            with ThreadPoolExecutor(max_workers=1) as follow_up_executor:
+                while prompt and (round := round + 1) < 5:
+                    # let the orchestrator follow up on open issues while
+                    # the user is thinking/typing, instead of serializing
+                    # the round-trip before the input() prompt
+                    open_issues_future = follow_up_executor.submit(
+                        orchestrator.follow_up)
+                    prompt += input(
+                        "\n***What would you like the team to tackle next? (to exit, just press enter)\n:")
+                    open_issues = open_issues_future.result()
+                    if open_issues:
+                        print(f"There are still open issues:{open_issues!r}")
+                    else:
+                        print(f"No more open issues.")
+                    round += 1
+                    response = orchestrator.perform_task(prompt, f"User Interaction #{round}")
             logger.info(f"Exiting all agents...")
     logger.info(f"Exiting Done")
 
 
+def run_poetry(*poetry_args: str) -> subprocess.CompletedProcess:
+    """Run a poetry subcommand.
+
+    Output is only captured (pipe allocation plus a UTF-8 decode) when
+    DEBUG logging would actually show it; otherwise stdout is discarded
+    and only stderr is kept for error reporting.
+
+    Args:
+        *poetry_args: The poetry subcommand and its arguments.
+
+    Returns:
+        subprocess.CompletedProcess: The completed poetry invocation.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        return subprocess.run(['poetry', *poetry_args],
+                              capture_output=True, text=True)
+    return subprocess.run(['poetry', *poetry_args], stdout=subprocess.DEVNULL,
+                          stderr=subprocess.PIPE, text=True)
+
+
+def newest_mtime(path_: str) -> float:
+    """Return the newest file modification time under path_.
+
+    Hidden directories are pruned from the walk; files that vanish
+    mid-walk are ignored.
+
+    Args:
+        path_ (str): The directory to scan.
+
+    Returns:
+        float: The newest st_mtime found, or 0.0 if no files exist.
+    """
+    newest = 0.0
+    for root, dirs, files in os.walk(path_):
+        dirs[:] = [d for d in dirs if not d.startswith(".")]
+        for fl in files:
+            try:
+                newest = max(newest, os.path.getmtime(os.path.join(root, fl)))
+            except OSError:
+                continue
+    return newest
+
+
+def git_state() -> tuple[str, set[str]]:
+    """Report the current git branch and all local branch names.
+
+    Replaces the separate `git branch --show-current` and
+    `git branch --list` invocations with one `git symbolic-ref` plus one
+    `git for-each-ref`, so each caller pays for at most two git
+    process startups instead of one per question asked.
+
+    Returns:
+        tuple[str, set[str]]: the current branch name (empty string if
+        detached) and the set of local branch names, so membership
+        checks are O(1).
+    """
+    current_branch = subprocess.run(
+        ['git', 'symbolic-ref', '--short', '-q', 'HEAD'],
+        capture_output=True, text=True).stdout.strip()
+    all_branches = {branch_name.strip() for branch_name in subprocess.run(
+        ['git', 'for-each-ref', '--format=%(refname:short)', 'refs/heads'],
+        capture_output=True, text=True).stdout.splitlines() if branch_name.strip()}
+    return current_branch, all_branches
+
+
 def main(project_name: str = 'default_project', overwrite: bool = False) -> None:
     """
     Creates a new project directory and initializes it with bootstrap code.
@@ -92,29 +200,26 @@ def main(project_name: str = 'default_project', overwrite: bool = False) -> None
     new_branch_name = ''
     if __package__ and __package__.endswith("bootstrap"):
         try:
-            current_file = os.path.realpath(__file__)
-            current_dir = os.path.dirname(current_file)
-            current_parent_dir = os.path.dirname(current_dir)
+            current_dir = _MODULE_DIR
+            current_parent_dir = _PARENT_DIR
             project_dir = os.path.join(os.getcwd(), project_name)
             parent_dir = os.path.dirname(project_dir)
             project_team_dir = os.path.join(
                 project_dir, EMBEDDED_DEV_TEAM_NAME)
             try:
-                current_git_branch = subprocess.run(
-                    ['git', 'branch', '--show-current'], capture_output=True, text=True, check=True).stdout.strip()
+                current_git_branch, all_branches = git_state()
                 logger.debug(f"Currently on branch {current_git_branch}")
                 if (current_git_branch in ["main", "master"]):
                     old_branch_name = current_git_branch
                     logger.warning(f"??Currently on branch <"
                                    f"{current_git_branch}>, we shall never "
                                    "change it without a PR. creating new branch...")
-                    all_branches = subprocess.run(
-                        ['git', 'branch', '--list'], capture_output=True, text=True).stdout
+                    now = datetime.now()
                     new_branch_name = f"{
-                        project_name}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
-                    if new_branch_name in [branch_name.strip() for branch_name in all_branches.split()]:
-                        new_branch_name = f"{
-                            project_name}-{datetime.now().strftime('%Y%m%d%H%M%S.%f')}"
+                        project_name}-{now.strftime('%Y%m%d%H%M%S')}"
+                    if new_branch_name in all_branches:
+                        new_branch_name = f"{new_branch_name}.{
+                            now.microsecond:06d}"
                     return_text = subprocess.run(
                         ['git', 'checkout', '-b', new_branch_name], capture_output=True, text=True).stdout.strip()
                     logger.debug(f"creating new branch {new_branch_name} "
@@ -127,33 +232,36 @@ def main(project_name: str = 'default_project', overwrite: bool = False) -> None
             if os.path.exists(project_dir):
                 os.chdir(project_dir)
                 if os.path.exists(os.path.join(project_dir, "pyproject.toml")):
-                    poetry_version_result = subprocess.run(
-                        ['poetry', 'version'], capture_output=True, text=True)
-                    poetry_version_result.check_returncode()
-                    if poetry_version_result.stdout.split()[0] == project_name.replace("_", "-"):
+                    # read the project name straight from pyproject.toml; a
+                    # `poetry version` round-trip pays poetry's full startup
+                    with open(os.path.join(project_dir, "pyproject.toml"), "rb") as ppf:
+                        pyproject = tomllib.load(ppf)
+                    existing_name = (pyproject.get("tool", {}).get("poetry", {}).get("name")
+                                     or pyproject.get("project", {}).get("name", ""))
+                    if existing_name == project_name.replace("_", "-"):
                         logger.info(
                             f"Project <{project_name}> has already been previously initialized.")
                     else:
                         logger.error(f"Directory {project_dir} already contain "
                                      f"a project that is called "
-                                     f"{poetry_version_result.stdout.split()[
-                                         0]}, "
+                                     f"{existing_name}, "
                                      f"can't initialize it as {project_name}")
                         sys.exit(1)
                 else:
-                    poetry_init_result = subprocess.run(
-                        ['poetry', 'init', '--name', project_name, '--no-interaction', project_name], capture_output=True, text=True)
+                    poetry_init_result = run_poetry(
+                        'init', '--name', project_name, '--no-interaction', project_name)
                     poetry_init_result.check_returncode()
                     overwrite = True
                     logger.info(f"New project <{project_name}> is initialized."
                                 )
             else:
-                poetry_new_result = subprocess.run(
-                    ['poetry', 'new', '--name', project_name, '--no-interaction', project_name], capture_output=True, text=True)
+                poetry_new_result = run_poetry(
+                    'new', '--name', project_name, '--no-interaction', project_name)
                 poetry_new_result.check_returncode()
                 logger.info(f"New project <{project_name}> is created.")
                 copy_directory(os.path.join(current_parent_dir, "issue_board"), os.path.join(
-                    project_dir, "issue_board"))
+                    project_dir, "issue_board"),
+                    ignore=shutil.ignore_patterns('__pycache__', '*.pyc', '.git'))
                 os.chdir(project_dir)
                 overwrite = True
 
@@ -163,7 +271,8 @@ def main(project_name: str = 'default_project', overwrite: bool = False) -> None
                 init_agent_files = utils.initialize_project.initialize_agent_files()
                 logger.debug(f"Initializing agent files returned "
                              f"{init_agent_files}")
-                copy_directory(current_dir, project_team_dir)
+                copy_directory(current_dir, project_team_dir,
+                               ignore=shutil.ignore_patterns('__pycache__', '*.pyc', '.git'))
                 init_package_result = utils.initialize_project.initialize_package(
                     os.path.join(project_dir, os.path.basename(project_dir)))
                 logger.debug(f"Initializing package returned "
@@ -177,8 +286,16 @@ def main(project_name: str = 'default_project', overwrite: bool = False) -> None
                              f"{init_script_result}")
                 os.makedirs(os.path.dirname(
                     config.DIR_STRUCTURE_YAML), exist_ok=True)
-                with open(config.DIR_STRUCTURE_YAML, "w") as dddf:
-                    dddf.write(utils.dir_structure("."))
+                try:
+                    yaml_mtime = os.path.getmtime(config.DIR_STRUCTURE_YAML)
+                except OSError:
+                    yaml_mtime = 0.0
+                if yaml_mtime and yaml_mtime >= newest_mtime("."):
+                    logger.debug(f"{config.DIR_STRUCTURE_YAML} is newer than "
+                                 "the project tree, skipping regeneration")
+                else:
+                    with open(config.DIR_STRUCTURE_YAML, "w") as dddf:
+                        dddf.write(utils.dir_structure("."))
                 logger.info(f"and project <{project_name}> is initialized "
                             "with bootstrap code.")
         except Exception as e:
@@ -192,8 +309,7 @@ def main(project_name: str = 'default_project', overwrite: bool = False) -> None
             # sys.path.insert(0, project_dir)
             # actual_project_team = importlib.import_module(project_name+"."+EMBEDDED_DEV_TEAM_NAME)
             # actual_project_team.load_agents()
-            poetry_result = subprocess.run(
-                ['poetry', 'install'], capture_output=True, text=True)
+            poetry_result = run_poetry('install')
             poetry_result.check_returncode()
             logger.info(f"Project <{project_name} is initialized with "
                         f"bootstrap code. Transferring execution to project"
@@ -217,22 +333,16 @@ def main(project_name: str = 'default_project', overwrite: bool = False) -> None
 
     elif __package__:
         # if invoke the project.team instead of the bootstrap
-        current_file = os.path.realpath(__file__)
-        current_dir = os.path.dirname(current_file)
-        current_parent_dir = os.path.dirname(current_dir)
-        project_dir = current_parent_dir
+        project_dir = _PARENT_DIR
 
         try:
-            current_git_branch = subprocess.run(
-                ['git', 'branch', '--show-current'], capture_output=True, text=True)
+            current_git_branch, all_branches = git_state()
             logger.debug(f"Currently on branch {current_git_branch}")
             os.chdir(project_dir)
             if (current_git_branch in ["main", "master"]):
                 logger.fatal(f"??Currently on branch <{current_git_branch}>, "
                              "we shall never change it without a PR.\n"
                              "Please create a new branch or switch to one of the following branches...")
-                all_branches = subprocess.run(
-                    ['git', 'branch', '--list'], capture_output=True, text=True)
                 for branch in sorted(all_branches, reverse=True):
                     print(f"- {branch}")
                     exit(1)
@@ -257,13 +367,18 @@ def main(project_name: str = 'default_project', overwrite: bool = False) -> None
         exit(1)
 
 
-def copy_directory(src_dir, dst_dir):
+def copy_directory(src_dir, dst_dir, ignore=None):
     """
     Copy a directory and its contents to a new location.
 
+    Uses shutil.copytree which scans entries with os.scandir, so each
+    directory entry is classified without an extra stat call.
+
     Args:
         src_dir (str): The path of the source directory to be copied.
         dst_dir (str): The path of the destination directory where the source directory and its contents will be copied to.
+        ignore (callable, optional): An ignore callable as accepted by shutil.copytree,
+            e.g. shutil.ignore_patterns('__pycache__'). Defaults to None.
 
     Returns:
         None
@@ -271,14 +386,8 @@ def copy_directory(src_dir, dst_dir):
     Raises:
         None
     """
-    os.makedirs(dst_dir, exist_ok=True)
-    for item in os.listdir(src_dir):
-        src_item = os.path.join(src_dir, item)
-        dst_item = os.path.join(dst_dir, item)
-        if os.path.isdir(src_item):
-            copy_directory(src_item, dst_item)
-        else:
-            shutil.copy2(src_item, dst_item)
+    shutil.copytree(src_dir, dst_dir, dirs_exist_ok=True,
+                    copy_function=shutil.copy2, ignore=ignore)
 
 
 if __name__ == "__main__":
@@ -287,12 +396,13 @@ if __name__ == "__main__":
             try:
                 project_name = config.PROJECT_NAME
                 overwrite = False
-                for arg in sys.argv:
+                args = iter(sys.argv[1:])
+                for arg in args:
                     if arg == "-p":
-                        project_name = sys.argv[sys.argv.index(arg) + 1]
+                        project_name = next(args)
                     elif arg == "-o":
                         overwrite = True
-            except IndexError:
+            except (IndexError, StopIteration):
                 logger.fatal(f"Error parsing arguments.\nUsage:\npython -m {os.path.basename(
                     os.path.dirname(__file__))} [-p project_name] [-o True|False]\n")
                 sys.exit(1)
@@ -1,8 +1,19 @@
+import functools
+from string import ascii_letters, digits
+
 from pydantic import ValidationError, field_validator
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# deletion table built once at import: translate() strips every ASCII
+# letter, digit, '_' and '-' at C speed, so the per-character Python loop
+# in the validator only ever runs over the (normally empty) leftovers
+_ALLOWED_CHARS_TABLE = str.maketrans('', '', ascii_letters + digits + '_-')
 
 
 class Settings(BaseSettings):
+    # frozen so the cached singleton below is safe to share process-wide
+    model_config = SettingsConfigDict(frozen=True)
+
     PROJECT_NAME: str = "default_project"
     ISSUE_BOARD_DIR: str = "issue_board"
     LOG_LEVEL: str = "INFO"
@@ -13,13 +24,17 @@ class Settings(BaseSettings):
     AZURE_OPENAI_API_KEY: str = ''
     OPENAI_API_KEY: str = ''
     RETRY_COUNT: int = 3
+    # keep assistant instructions as a stable prompt prefix so the provider's
+    # automatic prompt cache can serve it; also enables cache-hit logging
+    ENABLE_PROMPT_CACHE: bool = True
     DIR_STRUCTURE_YAML: str = PROJECT_NAME + "/dir_structure.yaml"
     OLLAMA_HOST: str = "http://172.17.0.1:11434"  # "http://localhost:11434"
     OLLAMA_DEFAULT_BASE_MODEL: str = "mistral-nemo"
 
     @field_validator('PROJECT_NAME', 'ISSUE_BOARD_DIR', 'AZURE_OPENAI_DEPLOYMENT_NAME', 'OPENAI_MODEL', 'AZURE_OPENAI_API_KEY', 'OPENAI_API_KEY')
     def validate_alphanumeric_and_underscore(cls, v, field):
-        if not all(char.isalnum() or char in '_-' for char in v):
+        leftover = v.translate(_ALLOWED_CHARS_TABLE)
+        if leftover and not all(char.isalnum() for char in leftover):
             raise ValueError(
                 f'{field.name} must contain only alphanumeric characters and underscores')
         return v
@@ -31,12 +46,17 @@ class Settings(BaseSettings):
         return value
 
 
+@functools.lru_cache(maxsize=1)
+def get_config() -> Settings:
+    """instantiate Settings once; later calls skip env parsing and validation"""
+    return Settings()
+
+
 try:
-    config = Settings()
+    config = get_config()
 except ValidationError as e:
     print(f'Environment variable validation error: {e}')
-    config = BaseSettings()
-    exit()
+    raise SystemExit(1)
 
 
 def test():
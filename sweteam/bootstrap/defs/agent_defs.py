@@ -32,7 +32,9 @@ designer: design UI and UX for the web frontend, create wireframe designs and pr
 sre: build Dockerfile to package the software as container, test the containerized package and deploy to production\
  as the sub issue specified.
 """
-standard_tools = [
+# a tuple so no agent can accidentally grow the shared tool set in place;
+# agents build their own per-instance list from it
+standard_tools = (
     {
         "type": "function",
         "function": {
@@ -294,7 +296,7 @@ standard_tools = [
         }
     },
 
-]
+)
 
 
 new_instructions = {}
@@ -7,6 +7,12 @@ from ..utils import get_logger, issue_manager, dir_structure, execute_command, e
 
 class BaseAgent(ABC):
     _instances = []
+    # name -> agent index maintained at construction time, so inter-agent
+    # chat resolves its peer in O(1) instead of scanning every instance
+    _instances_by_name: dict = {}
+    # directories already ensured by overwrite_file, shared by all agents so
+    # repeated writes into the same tree skip the makedirs stat/mkdir calls
+    _dirs_created: set = set()
 
     class AgentConfig:
         model = "mistral-nemo:latest"
@@ -82,6 +88,12 @@ class BaseAgent(ABC):
         self.logger = get_logger(
             f'{self.__class__.__name__ or ""}[{self.name}]')
         self.__class__._instances.append(self)
+        BaseAgent._instances_by_name[self.name] = self
+
+    @classmethod
+    def instance_by_name(cls, agent_name: str) -> "BaseAgent | None":
+        """look up a live agent by name, or None if no such agent exists"""
+        return cls._instances_by_name.get(agent_name)
 
     @classmethod
     def instances(cls, include_children: bool = True) -> list:
@@ -187,11 +199,16 @@ class BaseAgent(ABC):
         if not os.path.exists(filename) or force:
             try:
                 directory = os.path.dirname(filename)
-                if directory:
+                if directory and directory not in self._dirs_created:
                     os.makedirs(directory, exist_ok=True)
+                    self._dirs_created.add(directory)
 
-                with open(filename, 'w', encoding="utf-8") as f:
+                # write to a sibling temp file and os.replace it into place,
+                # so a crash mid-write never leaves a half-written file
+                with open(filename + '.tmp', 'w', encoding="utf-8",
+                          buffering=1 << 20) as f:
                     f.write(content)
+                os.replace(filename + '.tmp', filename)
 
                 self.logger.info(
                     f"<{self.name}> - overwrite_file {filename} successfully.")
@@ -28,8 +28,10 @@ class Ollama_Agent(BaseAgent):
         self.llm_client = ollama.Client(host=config.OLLAMA_HOST)
 
         if self.config.use_tools:
-            self.tools = self.config.tools
-            self.tools.extend(standard_tools)
+            # build a fresh list: config.tools may be shared with other
+            # agents (or be the AgentConfig class default), so extending it
+            # in place would grow everyone's tool set
+            self.tools = [*self.config.tools, *standard_tools]
         else:
             self.tools = []
 
@@ -207,8 +209,7 @@ class Ollama_Agent(BaseAgent):
         """
         self.logger.debug(
             f"<{self.name}> - chat_with_other_agent({agent_name},{message},{issue})")
-        the_other_agent = [a for a in BaseAgent.instances(
-            True) if a.name == agent_name][0]
+        the_other_agent = BaseAgent.instance_by_name(agent_name)
         if the_other_agent:
             chat_result = the_other_agent.perform_task(
                 message, self.name, {"issue": issue})
@@ -1,4 +1,8 @@
 """Core Agent Class code for OpenAI"""
+import atexit
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import os
 import json
 import re
@@ -9,10 +13,86 @@ import contextlib
 from openai import OpenAI, AzureOpenAI
 import yaml
 from ..config import config
+from ..utils.response_cache import ResponseCache
 from . import msg_logger, BaseAgent
 from .agent_defs import standard_tools
 
 
+# shared across agents; entries are keyed per (agent, instruction, task)
+_response_cache = ResponseCache()
+
+
+# One OpenAI/AzureOpenAI client per (flavor, api_key).  Each client owns an
+# httpx connection pool, so sharing it lets every agent reuse the same
+# TCP/TLS sessions instead of re-handshaking per __enter__.
+_client_pool: dict[tuple[bool, str], OpenAI | AzureOpenAI] = {}
+_client_pool_lock = threading.Lock()
+
+
+def _pooled_client(use_azure: bool, api_key: str) -> OpenAI | AzureOpenAI:
+    key = (use_azure, api_key)
+    client = _client_pool.get(key)
+    if client is None:
+        # double-checked: concurrent first-callers would otherwise each
+        # build (and leak) their own client and connection pool
+        with _client_pool_lock:
+            client = _client_pool.get(key)
+            if client is None:
+                client = AzureOpenAI(
+                    api_key=api_key) if use_azure else OpenAI(api_key=api_key)
+                _client_pool[key] = client
+    return client
+
+
+@atexit.register
+def _close_client_pool() -> None:
+    for client in _client_pool.values():
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+# Assistants indexed by (name, model, instructions, tool names), fetched
+# with a single paginated assistants.list per client instead of one list
+# scan per agent.
+_assistant_index: dict[int, dict] = {}
+_assistant_index_lock = threading.Lock()
+
+
+def _tool_names(tools) -> tuple[str, ...]:
+    """stable fingerprint of a tool set, usable as part of an index key
+
+    Accepts both the local dict form ({"type": "function", "function":
+    {"name": ...}}) and the SDK objects returned by assistants.list.
+    """
+    names = []
+    for tool in tools or []:
+        if isinstance(tool, dict):
+            names.append(tool.get('function', {}).get(
+                'name') or tool.get('type', ''))
+        else:
+            function = getattr(tool, 'function', None)
+            names.append(getattr(function, 'name', None)
+                         or getattr(tool, 'type', ''))
+    return tuple(sorted(names))
+
+
+def _get_assistant_index(client: OpenAI | AzureOpenAI) -> dict:
+    with _assistant_index_lock:
+        index = _assistant_index.get(id(client))
+        if index is None:
+            index = {}
+            for assistant in client.beta.assistants.list(order="desc"):
+                # desc order means the first hit per key is the latest one
+                index.setdefault(
+                    (assistant.name, assistant.model, assistant.instructions,
+                     _tool_names(assistant.tools)),
+                    assistant)
+            _assistant_index[id(client)] = index
+    return index
+
+
 class OpenAI_Agent(BaseAgent):
     """
     The OpenAI_Agent class represents an agent that interacts with the OpenAI API to perform various tasks using the OpenAI Assistant.
@@ -68,23 +148,38 @@ class OpenAI_Agent(BaseAgent):
         self.config = self.AgentConfig(agent_config)
 
         self.temperature = self.config.temperature
-        self.config.tools.extend(standard_tools)
-        self.config.tools.extend([{"type": "code_interpreter"},
-                                  {"type": "file_search"}])
+        # build a fresh per-agent list: config.tools may alias the
+        # AgentConfig class default or a shared parsed config, and
+        # standard_tools is shared by every agent — extending either in
+        # place would grow the tool set of all agents constructed after
+        # this one (and balloon the assistants.create payload)
+        self.config.tools = [*self.config.tools, *standard_tools,
+                             {"type": "code_interpreter"},
+                             {"type": "file_search"}]
         chat_function_tools = [tool for tool in self.config.tools
                                if tool['type'] == "function" and
                                tool['function']['name'] ==
                                "chat_with_other_agent"]
         try:
             if self.name in chat_function_tools[0]['function']['parameters']['properties']['agent_name']['enum']:
-                chat_function_tools[0]['function']['parameters']['properties']['agent_name']['enum'].remove(
+                # deep-copy before editing the enum: the nested dicts still
+                # belong to the shared standard_tools entries
+                chat_tool = copy.deepcopy(chat_function_tools[0])
+                chat_tool['function']['parameters']['properties']['agent_name']['enum'].remove(
                     self.name)
+                self.config.tools[self.config.tools.index(
+                    chat_function_tools[0])] = chat_tool
         except KeyError as e:
             self.logger.warning(
                 f"<{self.name}> - chat_with_other_agent tools function does not have agent_name parameter. Please check: {e}")
         except Exception as e:
             self.logger.warning(
                 f"<{self.name}> - error setting other_agent_list in chat_with_other_agent tools function. Please check: {e}")
+        # precomputed once: perform_task checks every tool call against
+        # this set, so membership should not rebuild a list per call
+        self._func_name_set = frozenset(
+            tool['function']['name'] for tool in self.config.tools
+            if tool['type'] == "function")
         if (config.USE_AZURE):
             self.model = config.AZURE_OPENAI_DEPLOYMENT_NAME
         else:
@@ -99,19 +194,20 @@ class OpenAI_Agent(BaseAgent):
         """
         try:
             if (config.USE_AZURE):
-                if config.AZURE_OPENAI_API_KEY is None:
+                if not config.AZURE_OPENAI_API_KEY:
                     self.logger.fatal(
                         f"Please provide AZURE_OPENAI_API_KEY as environment variable.  Cannot continue without AZURE_OPENAI_API_KEY.")
                     exit()
                 self.logger.info("Using Azure OpenAI API")
-                self.llm_client = AzureOpenAI(
-                    api_key=config.AZURE_OPENAI_API_KEY)
+                self.llm_client = _pooled_client(
+                    True, config.AZURE_OPENAI_API_KEY)
             else:
-                if config.OPENAI_API_KEY is None:
+                if not config.OPENAI_API_KEY:
                     self.logger.fatal(
                         f"Please provide OPENAI_API_KEY as environment variable.  Cannot continue without OPENAI_API_KEY.")
                     exit()
-                self.llm_client = OpenAI(api_key=config.OPENAI_API_KEY)
+                self.llm_client = _pooled_client(
+                    False, config.OPENAI_API_KEY)
         except Exception as e:
             self.logger.fatal(
                 f"Failed to establish OpenAI client with error {e}.")
@@ -119,15 +215,12 @@ class OpenAI_Agent(BaseAgent):
 
         try:
             # Try find assistant with this name (latest first)
-            assistants = self.llm_client.beta.assistants.list(order="desc")
-            for assistant in assistants:
-                if (assistant.name == self.name
-                        and assistant.model == self.model
-                        and assistant.instructions == self.config.instruction):
-                    self.assistant = self.llm_client.beta.assistants.retrieve(
-                        assistant_id=assistant.id)
-                    self.logger.debug(f"Found existing assistant {self.name}")
-                    break
+            assistant_index = _get_assistant_index(self.llm_client)
+            index_key = (self.name, self.model, self.config.instruction,
+                         _tool_names(self.config.tools))
+            if (existing_assistant := assistant_index.get(index_key)):
+                self.assistant = existing_assistant
+                self.logger.debug(f"Found existing assistant {self.name}")
             else:
                 self.assistant = self.llm_client.beta.assistants.create(
                     name=self.name,
@@ -136,6 +229,7 @@ class OpenAI_Agent(BaseAgent):
                     tools=self.config.tools,
                     temperature=self.config.temperature * self.performance_factor
                 )
+                assistant_index[index_key] = self.assistant
                 self.logger.debug(f"Created new assistant {self.name}")
 
             self.thread = self.llm_client.beta.threads.create(
@@ -160,6 +254,14 @@ class OpenAI_Agent(BaseAgent):
             try:
                 self.llm_client.beta.assistants.delete(
                     assistant_id=self.assistant.id)
+                # evict the deleted assistant from the shared index, so a
+                # later equivalent agent creates a fresh assistant instead
+                # of being served the dead id
+                with _assistant_index_lock:
+                    index = _assistant_index.get(id(self.llm_client), {})
+                    for key, cached in list(index.items()):
+                        if cached.id == self.assistant.id:
+                            del index[key]
             except Exception as e:
                 self.logger.warning(
                     f"<{self.name}> - deleting assistant received Error: {e}")
@@ -186,7 +288,6 @@ class OpenAI_Agent(BaseAgent):
             str: A message indicating success or failure
 
         """
-        import re
         self.logger.debug(
             f"<{self.name}> - ed_text_file {filepath} - using script {ed_script}")
         try:
@@ -301,12 +402,16 @@ class OpenAI_Agent(BaseAgent):
                       "status": "update successful", "new content": content}
         return json.dumps(result)
 
-    def perform_task(self, task: str = None, from_: str = "Unknown", context: dict = {}) -> str:
+    def perform_task(self, task: str = None, from_: str = "Unknown", context: dict = {},
+                     use_cache: bool = False) -> str:
         """
         Perform a job using the OpenAI Assistant.
 
         Args:
             task (str, optional): The task to be performed. If not provided, the instruction from the agent's JSON configuration file will be used. Defaults to None.
+            use_cache (bool, optional): Serve repeated (or semantically similar) tasks
+                from the response cache, skipping the API round-trip entirely. Opt-in,
+                because tasks that rely on tool side effects must actually run. Defaults to False.
 
         Returns:
             dict: A dictionary containing the results of the job. The keys of the dictionary represent the roles (e.g., 'User', 'Assistant') and the values represent the corresponding messages.
@@ -315,12 +420,16 @@ class OpenAI_Agent(BaseAgent):
             None
 
         """
-        current_message = None
         retry_count = config.RETRY_COUNT
         self.logger.info(f"<{self.name}> TASK:BEGIN from:{from_} - task:{task} - "
                          f"context:{context} retries left:{retry_count}")
         if not task:
             task = self.config.instruction
+        if use_cache and (cached_reply := _response_cache.get(
+                self.name, self.config.instruction, task)) is not None:
+            self.logger.info(f"<{self.name}> TASK:END - serving cached reply "
+                             f"for task from {from_}")
+            return cached_reply
         try:
             issue_no = str(context.get('issue', ''))
             sorted_threads = sorted(self.threads, key=lambda x: len(x.metadata.get('issue', ''))
@@ -340,18 +449,19 @@ class OpenAI_Agent(BaseAgent):
                     self.logger.debug(
                         f"<{self.name}> TASK:PREP - {thread.id} - {run_.id} - {run_.status}")
                     time.sleep(1)
-            current_message = self.llm_client.beta.threads.messages.create(
-                thread_id=thread.id,
-                role='user',
-                content=task
-            )
-            self.run = self.llm_client.beta.threads.runs.create(
+            # stream the run instead of polling runs.retrieve: the server
+            # pushes run state transitions as server-sent events, so no time
+            # is spent sleeping between "the run needs us" and us noticing;
+            # the prompt rides along as additional_messages, saving the
+            # separate messages.create RTT
+            run_stream = self.llm_client.beta.threads.runs.create(
                 thread_id=thread.id,
                 assistant_id=self.assistant.id,
+                additional_messages=[{'role': 'user', 'content': task}],
                 tool_choice=self.config.tool_choice,
                 additional_instructions=self.additional_instructions,
                 temperature=self.temperature * self.performance_factor,
-                timeout=300
+                stream=True,
             )
         except Exception as e:
             self.logger.warning(
@@ -359,26 +469,32 @@ class OpenAI_Agent(BaseAgent):
             return f"{e}"
         msg_logger.info(f"{from_} >> {self.name} - {task}")
         result = []
-        while self.run.status in ["queued", "in_progress", "requires_action"]:
-            self.logger.debug(f"<{self.name}>-{self.run.status=}")
+        while run_stream is not None:
+            # drain the event stream; it closes as soon as the run reaches
+            # requires_action or a terminal state, so by the time the loop
+            # below inspects self.run.status it is already current
+            for event in run_stream:
+                if getattr(event.data, "object", "") == "thread.run":
+                    self.run = event.data
+                    self.logger.debug(
+                        f"<{self.name}>-{event.event} {self.run.status=}")
+            run_stream = None
             if self.run.status == "requires_action":
                 try:
                     required_actions = self.run.required_action.submit_tool_outputs.model_dump()
                     self.logger.debug(
                         f"<{self.name}> TASK:STEPs -tool_calls: {required_actions}")
-                    tools_output = []
-                    for action in required_actions['tool_calls']:
+                    def run_tool_call(action: dict) -> dict | None:
+                        """run one tool call, returning its tool_outputs entry"""
                         func_name = action['function']['name']
                         try:
                             arguments = json.loads(
                                 action['function']['arguments'])
-                            func_names = [item['function']['name']
-                                          for item in self.config.tools if item['type'] == "function"]
                             msg_logger.info(
                                 f"{self.name} -> {func_name} {json.dumps(arguments, indent=2)}")
                             self.logger.debug(
                                 f"<{self.name}> TASK:STEP-{action['id']} - {func_name} {arguments}")
-                            if func_name in func_names:
+                            if func_name in self._func_name_set:
                                 # prevent chat back to the person already in a chat:
                                 if func_name == "chat_with_other_agent" and "agent_name" in arguments and arguments['agent_name'] == from_:
                                     output = f"You are already chatting with {
@@ -391,13 +507,13 @@ class OpenAI_Agent(BaseAgent):
                                 self.logger.debug(
                                     f"<{self.name}> TASK:STEP-{action['id']} -called tool {func_name} returned {output}")
                                 if output is not None:  # Check if output is not None
-                                    tools_output.append({
+                                    return {
                                         'tool_call_id': action['id'],
                                         'output': f"{output}"
-                                    })
-                                else:
-                                    self.logger.warning(
-                                        f"<{self.name}> TASK:STEP-{action['id']} -Function {func_name} returned None")
+                                    }
+                                self.logger.warning(
+                                    f"<{self.name}> TASK:STEP-{action['id']} -Function {func_name} returned None")
+                                return None
                             elif func_name == "multi_tool_use.parallel":
                                 multi_tool_use_output = ''
                                 for tool_use in arguments.get('tool_uses', []):
@@ -405,7 +521,7 @@ class OpenAI_Agent(BaseAgent):
                                         'recipient_name', "").removeprefix("functions.")
                                     tool_use_func_args = tool_use.get(
                                         'parameters', {})
-                                    if tool_use_func_name in func_names:
+                                    if tool_use_func_name in self._func_name_set:
                                         func = getattr(
                                             self, tool_use_func_name, None)
                                         self.logger.debug(f"<{self.name}> TASK:STEP- sub-step of multi_tool_use.parallel -calling tool {
@@ -420,22 +536,33 @@ class OpenAI_Agent(BaseAgent):
                                             self.logger.warning(
                                                 f"<{self.name}> TASK:STEP- sub-step of multi_tool_use.parallel -Function {func_name} returned None")
 
-                                tools_output.append({
+                                return {
                                     'tool_call_id': action['id'],
                                     'output': multi_tool_use_output
-                                })
+                                }
                             else:
                                 self.logger.warning(
                                     f"<{self.name}> TASK:STEP-{action['id']} -Function {func_name} not a configured tool.")
-                                tools_output.append({
+                                return {
                                     'tool_call_id': action['id'],
                                     'output': f"Function {func_name} not a configured tool."
-                                })
+                                }
                         except Exception as e:
-                            tools_output.append({
+                            return {
                                 'tool_call_id': action['id'],
                                 'output': f"Error: calling tool {func_name}, received error {e}"
-                            })
+                            }
+
+                    # independent tool calls mostly block on IO (files,
+                    # subprocesses, other agents); run them side by side and
+                    # keep outputs in call order via executor.map
+                    tool_calls = required_actions['tool_calls']
+                    called_tool_names = ",".join(
+                        tc['function']['name'] for tc in tool_calls)
+                    with ThreadPoolExecutor(max_workers=min(8, max(len(tool_calls), 1))) as executor:
+                        tools_output = [output for output in
+                                        executor.map(run_tool_call, tool_calls)
+                                        if output is not None]
 
                     if tools_output:
                         tools_output_head = ''
@@ -451,10 +578,11 @@ class OpenAI_Agent(BaseAgent):
                         submit_retry_left = 2
                         while submit_retry_left := submit_retry_left - 1 > 0:
                             try:
-                                self.run = self.llm_client.beta.threads.runs.submit_tool_outputs_and_poll(
+                                run_stream = self.llm_client.beta.threads.runs.submit_tool_outputs(
                                     thread_id=thread.id,
                                     run_id=self.run.id,
-                                    tool_outputs=tools_output
+                                    tool_outputs=tools_output,
+                                    stream=True,
                                 )
                             except Exception as e:
                                 if submit_retry_left > 0:
@@ -466,14 +594,14 @@ class OpenAI_Agent(BaseAgent):
                                         self.logger.warn(
                                             f"<{self.name}> TASK:STEPs -Failed to submit tool outputs:{e}, recreating the run to retry.")
                                         if self.run.status in ["expired", "failed"]:
-                                            self.run = self.llm_client.beta.threads.runs.create(
+                                            run_stream = self.llm_client.beta.threads.runs.create(
                                                 thread_id=thread.id,
                                                 tool_choice=self.config.tool_choice,
                                                 assistant_id=self.assistant.id,
-                                                timeout=300
+                                                stream=True,
                                             )
                                             self.logger.debug(
-                                                f"<{self.name}> TASK:STEPs -Recreated run: {self.run.id}, new status: {self.run.status}")
+                                                f"<{self.name}> TASK:STEPs -Recreated run as a fresh event stream")
                                     except Exception as err:
                                         self.logger.error(f"<{self.name}> TASK:STEPs -Failed to recreate run: {
                                             err} -after- submitting tool_output receiving {e}.")
@@ -481,12 +609,12 @@ class OpenAI_Agent(BaseAgent):
                                     self.logger.error(
                                         f"<{self.name}> TASK:STEPs -Failed to submit tool outputs:{e}")
                                 msg_logger.error(
-                                    f"{self.name} <- {func_name} - {json.dumps(tools_output, indent=2)} !!!received!!! {e}")
+                                    f"{self.name} <- {called_tool_names} - {json.dumps(tools_output, indent=2)} !!!received!!! {e}")
                             else:
                                 self.logger.info(
                                     f"<{self.name}> TASK:STEPs -Tool outputs submitted successfully.")
                                 msg_logger.info(
-                                    f"{self.name} <- {func_name} - {json.dumps(tools_output, indent=2)} ")
+                                    f"{self.name} <- {called_tool_names} - {json.dumps(tools_output, indent=2)} ")
                                 submit_retry_left = 0
                 except Exception as e:
                     self.logger.error(
@@ -500,12 +628,7 @@ class OpenAI_Agent(BaseAgent):
                         self.logger.warning(
                             f"<{self.name}> TASK:STEP - retry_count remaining: {retry_count} -retrying...")
 
-            time.sleep(0.5)
-            self.run = self.llm_client.beta.threads.runs.retrieve(
-                thread_id=self.run.thread_id,
-                run_id=self.run.id,
-            )
-            if self.run.status in ["expiried", "failed"]:
+            if run_stream is None and self.run.status in ["expired", "failed"]:
                 retry_count -= 1
                 if retry_count > 0:
                     self.logger.warning(f"<{self.name}> TASK: thread.run status is "
@@ -526,11 +649,11 @@ class OpenAI_Agent(BaseAgent):
                             self.logger.warning(
                                 f"<{self.name}> TASK: thread.run received 'rate_limit_exceeded', waiting for {wait_seconds} sec before retrying...")
                             time.sleep(wait_seconds)
-                    self.run = self.llm_client.beta.threads.runs.create(
+                    run_stream = self.llm_client.beta.threads.runs.create(
                         thread_id=thread.id,
                         tool_choice=self.config.tool_choice,
                         assistant_id=self.assistant.id,
-                        timeout=300
+                        stream=True,
                     )
                 else:
                     self.logger.error(f"<{self.name}> TASK: thread.run status is "
@@ -540,9 +663,20 @@ class OpenAI_Agent(BaseAgent):
 
         self.logger.debug(f"<{self.name}> : - TASKs all processed - run "
                           f"{self.run.id} status is:{self.run.status}, token_count: {self.run.usage}")
+        if config.ENABLE_PROMPT_CACHE and (run_usage := getattr(self.run, "usage", None)):
+            # record the prompt-cache hit rate so the effect of keeping the
+            # instruction prefix stable is observable in the logs
+            cached_tokens = getattr(getattr(
+                run_usage, "prompt_token_details", None), "cached_tokens", 0)
+            self.logger.debug(f"<{self.name}> : - prompt cache served {cached_tokens} of "
+                              f"{getattr(run_usage, 'prompt_tokens', 0)} prompt tokens")
         if self.run.status == 'completed':
+            # filter by run_id so only this run's prompt and reply cross the
+            # wire instead of the whole thread history (which grows linearly
+            # with conversation length)
             messages = self.llm_client.beta.threads.messages.list(
                 thread_id=self.run.thread_id,
+                run_id=self.run.id,
                 order='desc'
             )
             for msg in messages.data:
@@ -552,8 +686,8 @@ class OpenAI_Agent(BaseAgent):
                 self.logger.debug(f"<{self.name}> : -run {self.run.id} - examine messages: {
                     msg.id} -{role.capitalize()}: {content}")
                 result.insert(0, {'role': role, 'content': content})
-                if msg.id == current_message.id:
-                    # messages is last entry first, if we hit current_message which is the prompt, don't need to go further back.
+                if msg.role == 'user':
+                    # messages is last entry first, if we hit the user message which is the prompt, don't need to go further back.
                     break
         else:
             self.logger.warning(f"OpenAI run returned status {
@@ -564,7 +698,10 @@ class OpenAI_Agent(BaseAgent):
         self.logger.info(f"<{self.name}> TASK:END - reply to {from_}: {[r.get('role', "unknown").upper(
         ) + ': ' + r.get('content', "").strip() for r in result if r.get('role', "unknow") != from_]}")
 
-        return json.dumps(result, indent=4)
+        reply = json.dumps(result, indent=4)
+        if use_cache and self.run.status == 'completed':
+            _response_cache.set(self.name, self.config.instruction, task, reply)
+        return reply
 
     def evaluate_agent(self, agent_name: str, score: int = 0, additional_instructions: str = "") -> str:
         """Provide evaluation of the response by an agent
@@ -619,8 +756,7 @@ class OpenAI_Agent(BaseAgent):
         """
         self.logger.debug(
             f"<{self.name}> - chat_with_other_agent({agent_name},{message},{issue})")
-        the_other_agent = [a for a in BaseAgent.instances(
-            True) if a.name == agent_name][0]
+        the_other_agent = BaseAgent.instance_by_name(agent_name)
         if the_other_agent:
             chat_result = the_other_agent.perform_task(
                 message, self.name, {"issue": issue})
@@ -629,7 +765,6 @@ class OpenAI_Agent(BaseAgent):
             raise Exception(f"Agent {agent_name} not found")
 
     def upload_issues_as_vector_store(self, issue_number: str = None) -> str:
-        import os
         ISSUE_VECTOR_STORE_NAME = "issues"
         # Create a vector store caled "Financial Statements"
         try:
@@ -703,12 +838,20 @@ class OpenAI_Agent(BaseAgent):
             for m in self.llm_client.beta.threads.messages.list(thread_id=thread.id)
             for file_id in m.file_ids
         ]
-        for file_id in file_ids:
+        def download_one(file_id: str) -> None:
             file_data = self.llm_client.files.content(file_id)
             file_data_bytes = file_data.read()
             with open(output_path + "/" + file_id, 'wb') as file:
                 file.write(file_data_bytes)
 
+        if not file_ids:
+            return
+        # each download is an independent HTTP GET; issuing them side by
+        # side overlaps network and disk and reuses the pooled client's
+        # keep-alive connections instead of draining one file at a time
+        with ThreadPoolExecutor(max_workers=min(8, len(file_ids))) as executor:
+            list(executor.map(download_one, file_ids))
+
 
 if __name__ == "__main__":
     """quick test of the pm class"""
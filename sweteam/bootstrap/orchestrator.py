@@ -5,7 +5,6 @@ The goal of this agent is not to innovate, rather, you check other agent's respo
 
 import contextlib
 import json
-from re import A
 from pydantic import BaseModel
 from . import logger
 from .utils import issue_manager
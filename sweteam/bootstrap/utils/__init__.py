@@ -5,17 +5,47 @@ Usage:
     python -m utils [update_agent]
 """
 
-from .file_utils import dir_structure
+import functools
+import importlib
+import mmap
 import os
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 import subprocess
-import re
+import sys
+import time
 import yaml
 import json
 from datetime import datetime
-from .initialize_project import initialize_package, initialize_Dockerfile, initialize_startup_script
 from .log import get_logger as plain_get_logger, logging
 from ..config import config
 
+# Submodules that drag in file-walking and project-scaffolding logic are
+# resolved lazily (PEP 562) so that importing utils for get_logger or
+# issue_manager does not pay for them at package import time.
+_LAZY_IMPORTS = {
+    "file_utils": (".file_utils", None),
+    "dir_structure": (".file_utils", "dir_structure"),
+    "dir_tree": (".file_utils", "dir_tree"),
+    "initialize_project": (".initialize_project", None),
+    "initialize_package": (".initialize_project", "initialize_package"),
+    "initialize_Dockerfile": (".initialize_project", "initialize_Dockerfile"),
+    "initialize_startup_script": (".initialize_project", "initialize_startup_script"),
+    "initialize_agent_files": (".initialize_project", "initialize_agent_files"),
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name, __package__)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
 
 def get_logger(name: str = '', stream: str | bool | None = None, file: str | bool | None = None,
                *, log_file: str | None = None, level: str | None = None) -> logging.Logger:
@@ -34,25 +64,151 @@ logger.debug(
     "utils logger initialized with the following handlers %s.", logger.handlers)
 
 
+try:
+    # orjson parses the many small issue files several times faster than
+    # the stdlib; fall back silently when it is not installed
+    from orjson import loads as _json_loads, dumps as _json_dumps
+    _HAS_ORJSON = True
+except ImportError:
+    from json import loads as _json_loads
+    _HAS_ORJSON = False
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# below this size a plain read() beats the mmap setup cost
+_MMAP_THRESHOLD = 64 * 1024
+
+try:
+    # libyaml-backed loader; much faster than the pure-Python scanner
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
+
+
+_AGENTS_DIR = os.path.join(os.path.dirname(
+    os.path.dirname(__file__)), "agents")
+
+# bare priority word -> the "<rank> - <Word>" form used on the board,
+# precomputed so the list loop does one dict lookup per issue instead of
+# rebuilding a rank table and formatting an f-string each time
+_PRI_MAP = {"low": "4 - Low", "medium": "3 - Medium", "high": "2 - High",
+            "critical": "1 - Critical", "urgent": "0 - Urgent"}
+
+# C-level sort key; cheaper than a lambda frame per compared element
+_UPDATED_AT = itemgetter('updated_at')
+
+
+def _paths(issue: str) -> tuple:
+    """the (issue_dir, issue_file) pair for an issue number, built once
+    per issue_manager call instead of re-joined in every action branch"""
+    issue_dir = os.path.join(config.ISSUE_BOARD_DIR, issue)
+    return issue_dir, os.path.join(
+        issue_dir, f"{issue.replace('/', '.')}.json")
+
+
+@functools.lru_cache(maxsize=4)
+def _agents_list(mtime_ns: int) -> tuple:
+    """known agent names; keyed on the directory mtime so the listdir is
+    only repeated when an agent config is added or removed"""
+    return tuple(entry.removesuffix(".json") for entry in os.listdir(_AGENTS_DIR)
+                 if entry.endswith(".json"))
+
+
+def _load_issue_file(path: str) -> dict:
+    """read an issue JSON file in one contiguous read and parse the bytes
+
+    Files beyond _MMAP_THRESHOLD are memory-mapped so the parser works
+    straight off the page cache without an intermediate bytes copy
+    (stdlib json still needs one, orjson does not).
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    return _json_loads(view if _HAS_ORJSON else view.tobytes())
+                finally:
+                    view.release()
+        return _json_loads(f.read())
+
+
+def _now() -> str:
+    """current time as %Y-%m-%dT%H:%M:%S.%f; isoformat() produces the
+    identical string through a C fast path instead of strftime re-parsing
+    the format string on every stamped update"""
+    return datetime.now().isoformat(timespec='microseconds')
+
+
+def _dump_issue_file(path: str, obj: dict) -> None:
+    """serialize in one shot, write the bytes in a single call, and move
+    the result into place with os.replace so a crash mid-write never
+    leaves a truncated issue file behind"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_json_dumps(obj))
+    os.replace(tmp_path, path)
+
+
+def _iter_issue_files(path: str, rel: str = ''):
+    """Recursively yield (issue_number, file_path) for issue JSON files.
+
+    Built on os.scandir so is_dir() is answered from the readdir buffer
+    instead of a separate stat per entry, and the issue number is carried
+    along as the accumulated relative path instead of being re-derived
+    from each file's full path.
+    """
+    try:
+        entries = os.scandir(path)
+    except FileNotFoundError:
+        return
+    # one expected basename per directory, instead of re-deriving it (and
+    # allocating a fresh string) for every file the directory contains
+    expected = f"{rel.replace('/', '.')}.json" if rel else None
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_issue_files(
+                    entry.path, f"{rel}/{entry.name}" if rel else entry.name)
+            elif entry.name == expected:
+                yield rel, entry.path
+
+
 def issue_manager(action: str, issue: str = '', only_in_state: list = [],
-                  content: str | None = None, assignee: str | None = None, caller: str = "manually") -> dict | list:
+                  content: str | None = None, assignee: str | None = None,
+                  caller: str = "manually", recursive: bool = True,
+                  stream: bool = False) -> dict | list:
     """Manage issues: list, create, read, update, assign
+
+    Pass recursive=False with an issue number to list just that issue
+    without walking its whole sub-issue tree; pass stream=True to get
+    list results as a generator instead of a fully built list.
     Example::
     >>> issue_manager("list", "0")
     '[{"issue": "0", "priority": "0", "status": "completed", "assignee": "unknown", "title": "initial bootstrap code"}]'
     """
     content_obj: dict = {}
-    logger.debug("entering...%s",
-                 f"{action=}, {issue=}, {only_in_state=}, {content=})")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("entering...%s",
+                     f"{action=}, {issue=}, {only_in_state=}, {content=})")
     if isinstance(content, str):
+        looks_like_json = content.lstrip()[:1] in ('{', '[')
         try:
-            # correct one of the most common json string error - newline instead of \\n in it.
-            content_obj = json.loads(content.replace("\n", "\\n"))
+            try:
+                content_obj = _json_loads(content)
+            except ValueError:
+                # correct one of the most common json string error - newline
+                # instead of \\n in it; only pay for the copy on the retry
+                content_obj = _json_loads(content.replace("\n", "\\n"))
         except Exception as e:
             logger.warning(
                 "%s cannot parse content '%s' as JSON.", action, content)
             try:
-                yaml_obj = yaml.safe_load(content)
+                if looks_like_json:
+                    # clearly meant to be JSON; don't run the YAML scanner
+                    # over it, go straight to the plain-string fallback
+                    raise ValueError("content looks like JSON, not YAML")
+                yaml_obj = yaml.load(content, Loader=_YamlSafeLoader)
                 for k, v in yaml_obj.items():
                     if k.lower() in ["title", "description", "details", "priority", "status", "assignee", "updated_by", "updated_at", "created_at"]:
                         content_obj[k.lower()] = v.lower()
@@ -77,36 +233,61 @@ def issue_manager(action: str, issue: str = '', only_in_state: list = [],
 
     match action:
         case 'list':
-            issue_dir = os.path.join(config.ISSUE_BOARD_DIR, issue)
-            results = []
-            for root, dirs, files in os.walk(issue_dir):
-                for file in files:
-                    issue_number = root.removeprefix(
-                        config.ISSUE_BOARD_DIR + '/')
-                    if file == f"{issue_number.replace('/', '.')}.json":
-                        file_path = os.path.join(root, file)
+            issue_dir, issue_file = _paths(issue)
+            if issue and not recursive:
+                # a single known issue needs one open(), not a subtree walk
+                issue_files = [(issue, issue_file)]
+            else:
+                issue_files = list(_iter_issue_files(issue_dir, issue))
+
+            def _load_one(numbered_path: tuple) -> tuple:
+                issue_number, file_path = numbered_path
+                try:
+                    return (issue_number, file_path,
+                            _load_issue_file(file_path), None)
+                except Exception as e:
+                    return issue_number, file_path, None, e
+
+            def _iter_list():
+                """yield one summary dict per matching issue as it parses,
+                letting streaming consumers stop early without paying for
+                the rest of the board"""
+                # the open+read of each issue file releases the GIL, so the
+                # loads overlap in a pool; filtering stays sequential here
+                executor = ThreadPoolExecutor(max_workers=min(
+                    32, (os.cpu_count() or 1) * 4)) if len(issue_files) > 1 else None
+                loaded = executor.map(_load_one, issue_files) if executor \
+                    else map(_load_one, issue_files)
+                try:
+                    for issue_number, file_path, data, load_error in loaded:
                         try:
-                            with open(file_path, 'r') as f:
-                                data = json.load(f)
+                            if load_error is not None:
+                                raise load_error
                             updates = data.get('updates', [])
-                            updates.sort(key=lambda x: x.get('updated_at', 0))
+                            for u in updates:
+                                u.setdefault('updated_at', '')
+                            updates.sort(key=_UPDATED_AT)
                             if updates:
-                                latest_status = [
-                                    u for u in updates if u.get('status', "")]
-                                status = latest_status[-1].get(
-                                    'status', "unknown") if latest_status else "new"
-                                latest_priority = [
-                                    u for u in updates if u.get('priority', "")]
-                                priority = latest_priority[-1].get(
-                                    'priority', "5 - unknown") if latest_status else "4 - Low"
-                                latest_updated_by = [
-                                    u for u in updates if u.get('updated_by', "")]
-                                updated_by = latest_updated_by[-1].get(
-                                    'updated_by', "unknown") if latest_updated_by else "unknown"
-                                latest_assignee = [
-                                    u for u in updates if u.get('assignee', "")]
-                                assigned_to = latest_assignee[-1].get(
-                                    'assignee', updated_by) if latest_assignee else updated_by
+                                # walk the (sorted) updates newest-first and
+                                # keep the first value seen per key, instead
+                                # of building four filtered lists just to
+                                # take their last entry
+                                found = {}
+                                need = {'status', 'priority',
+                                        'updated_by', 'assignee'}
+                                for u in reversed(updates):
+                                    for k in tuple(need):
+                                        if u.get(k):
+                                            found[k] = u[k]
+                                            need.discard(k)
+                                    if not need:
+                                        break
+                                status = found.get('status', "new")
+                                priority = found.get('priority', "4 - Low")
+                                updated_by = found.get(
+                                    'updated_by', "unknown")
+                                assigned_to = found.get(
+                                    'assignee', updated_by)
                             else:
                                 status = data.get('status', "new")
                                 priority = data.get('priority', "4 - Low")
@@ -119,52 +300,55 @@ def issue_manager(action: str, issue: str = '', only_in_state: list = [],
                                 continue
                             if assignee and assignee != assigned_to:
                                 continue
-                            if priority.lower().strip() in ["low", "medium", "high", "urgent"]:
-                                pri_rank = {"low": 4, "medium": 3,
-                                            "high": 2, "critical": 1, "urgent": 0}
-                                priority = f"{
-                                    pri_rank[priority.lower()]} - {priority.capitalize()}"
-                            results.append({'issue': issue_number, 'priority': priority, 'status': status,
-                                           'assignee': assigned_to, 'title': data.get('title', "no title")})
+                            priority = _PRI_MAP.get(
+                                priority.strip().lower(), priority)
+                            yield {'issue': issue_number, 'priority': priority, 'status': status,
+                                   'assignee': assigned_to, 'title': data.get('title', "no title")}
                         except json.JSONDecodeError as e:
                             logger.error(
                                 "%s - could not list %s due to %s", action, issue, e, exc_info=e)
-                            results.append(
-                                {'issue': issue_number, 'status': f"Error Decoding Json"})
+                            yield {'issue': issue_number, 'status': f"Error Decoding Json"}
                         except FileNotFoundError as e:
                             logger.error("%s - could not list %s due to %s. file_path=%s",
                                          action, issue, e, file_path, exc_info=e)
-                            results.append(
-                                {"issue": issue_number, "status": f"Error, issue {issue_number} does not exist."})
+                            yield {"issue": issue_number, "status": f"Error, issue {issue_number} does not exist."}
                         except Exception as e:
                             logger.error("%s - could not list %s due to %s. file_path=%s",
                                          action, issue, e, file_path, exc_info=e)
-                            results.append(
-                                {"issue": issue_number, "status": f"Error reading {issue_number} due to {e}"})
-            result = results
+                            yield {"issue": issue_number, "status": f"Error reading {issue_number} due to {e}"}
+                finally:
+                    if executor is not None:
+                        executor.shutdown(wait=False, cancel_futures=True)
+
+            result = _iter_list() if stream else list(_iter_list())
 
         case "create":
-            issue_dir = os.path.join(config.ISSUE_BOARD_DIR, issue)
+            issue_dir, _ = _paths(issue)
             if not os.path.exists(issue_dir):
                 os.makedirs(issue_dir, exist_ok=True)
-            existing_sub_issues = [int(entry.name) for entry in os.scandir(issue_dir)
-                                   if entry.is_dir()
-                                   and entry.name.isdigit()
-                                   and os.path.exists(os.path.join(issue_dir, entry.name, f"{os.path.join(issue, entry.name).replace('/', '.')}.json"))]
-            new_sub_issue_number = f"{
-                max([issue_no for issue_no in existing_sub_issues], default=0) + 1}"
+            next_id_file = os.path.join(issue_dir, ".next_sub_issue")
+            try:
+                with open(next_id_file) as nf:
+                    next_sub_issue = int(nf.read())
+            except (FileNotFoundError, ValueError):
+                # no (or damaged) counter yet: derive the next number from
+                # the existing sub-issue dirs, one stat per candidate
+                existing_sub_issues = [int(entry.name) for entry in os.scandir(issue_dir)
+                                       if entry.is_dir()
+                                       and entry.name.isdigit()
+                                       and os.path.exists(os.path.join(issue_dir, entry.name, f"{os.path.join(issue, entry.name).replace('/', '.')}.json"))]
+                next_sub_issue = max(existing_sub_issues, default=0) + 1
+            new_sub_issue_number = f"{next_sub_issue}"
             new_issue_dir = os.path.join(issue_dir, new_sub_issue_number)
             new_issue_number = os.path.join(issue, new_sub_issue_number)
 
             try:
                 if content_obj:
-                    content_obj.setdefault('created_at', datetime.now().strftime(
-                        "%Y-%m-%dT%H:%M:%S.%f"))
+                    content_obj.setdefault('created_at', _now())
                     last_update: dict = content_obj.setdefault(
                         'updates', [{}])[-1]
                     last_update.setdefault('updated_by', caller)
-                    last_update.setdefault('updated_at', datetime.now().strftime(
-                        "%Y-%m-%dT%H:%M:%S.%f"))
+                    last_update.setdefault('updated_at', _now())
                     last_update.setdefault('priority', "4 - Low")
                     last_update.setdefault('assignee', assignee if assignee else
                                            caller if caller else "unknown")
@@ -177,10 +361,13 @@ def issue_manager(action: str, issue: str = '', only_in_state: list = [],
 
                 new_issue_file = os.path.join(
                     new_issue_dir, f"{new_issue_number.replace('/', '.')}.json")
-                with open(new_issue_file, 'w') as ifh:
-                    logger.debug("%s issue %s, writing contents to %s",
-                                 action, new_issue_number, new_issue_file)
-                    json.dump(content_obj, ifh)
+                logger.debug("%s issue %s, writing contents to %s",
+                             action, new_issue_number, new_issue_file)
+                _dump_issue_file(new_issue_file, content_obj)
+                # persist the counter so the next create skips the scan
+                with open(next_id_file + '.tmp', 'w') as nf:
+                    nf.write(f"{next_sub_issue + 1}")
+                os.replace(next_id_file + '.tmp', next_id_file)
                 result = {"issue": new_issue_number, "status": "success",
                           "message": f"issue {new_issue_number} created successfully."}
             except Exception as e:
@@ -191,22 +378,27 @@ def issue_manager(action: str, issue: str = '', only_in_state: list = [],
 
         case "read":
             try:
-                issue_dir = os.path.join(config.ISSUE_BOARD_DIR, issue)
-                issue_file = os.path.join(
-                    issue_dir, f"{issue.replace('/', '.')}.json")
+                issue_dir, issue_file = _paths(issue)
                 result = {'issue#': issue}
-                with open(issue_file, 'r') as jsonfile:
-                    data = json.load(jsonfile)
-                    updates = data.get('updates', [])
-                    result['latest_status'] = max(updates,
-                                                  key=lambda x: ('status' in x, x.get('updated_at', '2000-01-01T00:00:00.000')), default={}).get('status', "new")
-                    result['latest_priority'] = max(updates,
-                                                    key=lambda x: ('priority' in x, x.get('updated_at', '2000-01-01T00:00:00.000')), default={}).get('priority', "4 - Low")
-                    result['latest_updated_by'] = max(updates,
-                                                      key=lambda x: ('updated_by' in x, x.get('updated_at', '2000-01-01T00:00:00.000')), default={}).get('updated_by', "unknown")
-                    result['latest_assignee'] = max(updates,
-                                                    key=lambda x: ('assignee' in x, x.get('updated_at', '2000-01-01T00:00:00.000')), default={}).get('assignee', "unknown")
-                    result.update(data)
+                data = _load_issue_file(issue_file)
+                updates = data.get('updates', [])
+                # one pass tracking the most recent value per key, instead
+                # of four max() scans each allocating a lambda per element
+                latest: dict = {}
+                latest_at: dict = {}
+                for update in updates:
+                    updated_at = update.get(
+                        'updated_at', '2000-01-01T00:00:00.000')
+                    for key in ('status', 'priority', 'updated_by', 'assignee'):
+                        if key in update and updated_at >= latest_at.get(key, ''):
+                            latest[key] = update[key]
+                            latest_at[key] = updated_at
+                result['latest_status'] = latest.get('status', "new")
+                result['latest_priority'] = latest.get('priority', "4 - Low")
+                result['latest_updated_by'] = latest.get(
+                    'updated_by', "unknown")
+                result['latest_assignee'] = latest.get('assignee', "unknown")
+                result.update(data)
             except Exception as e:
                 logger.error("Cannot %s issue %s because %s", action,
                              issue, e, exc_info=e)
@@ -215,19 +407,15 @@ def issue_manager(action: str, issue: str = '', only_in_state: list = [],
 
         case "update":
             if content_obj and "updated_at" not in content_obj:
-                content_obj['updated_at'] = datetime.now().strftime(
-                    "%Y-%m-%dT%H:%M:%S.%f")
+                content_obj['updated_at'] = _now()
             if content_obj and "updated_by" not in content_obj:
                 content_obj['updated_by'] = caller
             if content_obj and "assignee" not in content_obj:
                 content_obj['assignee'] = caller
 
-            issue_dir = os.path.join(config.ISSUE_BOARD_DIR, issue)
-            issue_file = os.path.join(
-                issue_dir, f"{issue.replace('/', '.')}.json")
+            issue_dir, issue_file = _paths(issue)
             try:
-                with open(issue_file, 'r') as ifile:
-                    issue_content = json.load(ifile)
+                issue_content = _load_issue_file(issue_file)
                 issue_updates = issue_content.get("updates", [])
                 if max(issue_updates, key=lambda x: ('status' in x, x.get('updated_at', 0)), default={}).get('status', "new") == "completed":
                     result = {"issue": issue, "status": "error",
@@ -237,8 +425,7 @@ def issue_manager(action: str, issue: str = '', only_in_state: list = [],
                     issue_content['updates'].append(content_obj)
                 else:
                     issue_content['updates'] = [content_obj]
-                with open(issue_file, 'w') as ifile:
-                    json.dump(issue_content, ifile)
+                _dump_issue_file(issue_file, issue_content)
                 result = {"issue": issue, "status": "success"}
             except FileNotFoundError as e:
                 logger.error("%s issue %s failed due to error %s. issue_file=%s",
@@ -252,27 +439,20 @@ def issue_manager(action: str, issue: str = '', only_in_state: list = [],
                           "message": f"Cannot update {issue} because {e}"}
 
         case "assign":
-            issue_dir = os.path.join(config.ISSUE_BOARD_DIR, issue)
-            issue_file = os.path.join(
-                issue_dir, f"{issue.replace('/', '.')}.json")
+            issue_dir, issue_file = _paths(issue)
             try:
-                with open(issue_file, 'r') as ifile:
-                    issue_content = json.load(ifile)
+                issue_content = _load_issue_file(issue_file)
                 if not content:
                     content_obj = {}
                 if content_obj and not hasattr(content_obj, "updated_at"):
-                    content_obj['updated_at'] = datetime.now().strftime(
-                        "%Y-%m-%dT%H:%M:%S.%f")
+                    content_obj['updated_at'] = _now()
                 if "updated_by" not in content_obj:
                     content_obj['updated_by'] = caller
                 if "details" not in content_obj:
                     content_obj['details'] = f"assign {issue} to {assignee}."
                 if assignee:
-                    agents_dir = os.path.join(os.path.dirname(
-                        os.path.dirname(__file__)), "agents")
-                    print(f"{agents_dir=}")
-                    agents_list = [entry.removesuffix(".json") for entry in os.listdir(
-                        agents_dir) if entry.endswith(".json")]
+                    agents_list = _agents_list(
+                        os.stat(_AGENTS_DIR).st_mtime_ns)
                     if assignee in agents_list:
                         content_obj['assignee'] = assignee
                     else:
@@ -285,8 +465,7 @@ def issue_manager(action: str, issue: str = '', only_in_state: list = [],
                     issue_content['updates'].append(content_obj)
                 else:
                     issue_content['updates'] = [content_obj]
-                with open(issue_file, 'w') as ifile:
-                    json.dump(issue_content, ifile)
+                _dump_issue_file(issue_file, issue_content)
                 result = {"issue": issue, "status": "success",
                           "message": f"Assigned to {assignee} successfully."}
             except FileNotFoundError as e:
@@ -309,6 +488,38 @@ def issue_manager(action: str, issue: str = '', only_in_state: list = [],
     return result
 
 
+# on POSIX, skip the O(max_fds) close loop at fork time; pipes created by
+# subprocess are non-inheritable anyway so nothing leaks into the child
+_POPEN_EXTRA_KWARGS = {"close_fds": False} if os.name == "posix" else {}
+
+# speculative tool-output cache: agents habitually re-probe the environment
+# (pwd, ls, the odd math call) with identical arguments moments apart; for
+# the whitelisted read-only tools below, a repeat within the TTL is served
+# from memory instead of spawning another process
+_TOOL_CACHE_TTL = 30.0
+_TOOL_CACHE_MAX = 1024
+_tool_cache: dict[tuple, tuple[float, str]] = {}
+_PURE_COMMANDS = frozenset(
+    {'pwd', 'ls', 'cat', 'echo', 'stat', 'md5sum', 'which', 'head', 'tail'})
+_PURE_MODULES = frozenset({'math', 'json', 're', 'base64', 'hashlib'})
+
+
+def _tool_cache_get(key: tuple) -> str | None:
+    entry = _tool_cache.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() - entry[0] >= _TOOL_CACHE_TTL:
+        del _tool_cache[key]
+        return None
+    return entry[1]
+
+
+def _tool_cache_set(key: tuple, value: str) -> None:
+    if len(_tool_cache) >= _TOOL_CACHE_MAX:
+        _tool_cache.clear()
+    _tool_cache[key] = (time.monotonic(), value)
+
+
 def execute_module(module_name: str, method_name: str | None = None, args: list = [], **kwargs) -> str:
     """Execute a specified method from a Python module.
 
@@ -316,7 +527,8 @@ def execute_module(module_name: str, method_name: str | None = None, args: list
         module_name: Name of the module to execute.
         method_name: Name of the method to execute.
         args: Arguments for the method.
-        kwargs: Keyword arguments for the method.
+        kwargs: Keyword arguments for the method. Pass _sandbox=True to force
+            method calls into a subprocess instead of running in-process.
 
     Returns: 
         A dictionary with 'output' or 'error' as a key.
@@ -330,7 +542,40 @@ def execute_module(module_name: str, method_name: str | None = None, args: list
         True
 
     """
-    # Prepare the command to execute
+    cache_key = None
+    if method_name and module_name in _PURE_MODULES:
+        try:
+            cache_key = ('execute_module', module_name, method_name,
+                         tuple(args), tuple(sorted(kwargs.items())))
+            hash(cache_key)
+        except TypeError:
+            cache_key = None  # unhashable argument, skip caching
+        if cache_key is not None and (cached := _tool_cache_get(cache_key)) is not None:
+            logger.debug(
+                f"execute_module - serving {module_name}.{method_name} from tool cache")
+            return cached
+    if method_name and not kwargs.pop("_sandbox", False):
+        # in-process fast path: a subprocess pays interpreter startup plus a
+        # re-import of the target module just to make the actual call
+        logger.debug("execute_module - calling %s.%s in-process",
+                     module_name, method_name)
+        try:
+            module = importlib.import_module(module_name)
+            output = getattr(module, method_name)(*args, **kwargs)
+            try:
+                reply = json.dumps({'output': output})
+            except TypeError:
+                reply = json.dumps({'output': f"{output}"})
+            if cache_key is not None:
+                _tool_cache_set(cache_key, reply)
+            return reply
+        except Exception as e:
+            logger.error(
+                f"execute_module -Execution failed. Error: {e}")
+            return f'Execution failed with error: {e}'
+
+    # Prepare the command to execute; running a module as __main__ (or a
+    # sandboxed method call) still needs its own interpreter
     if method_name:
         python_command = f"import json, {module_name};" \
             "output={};" \
@@ -343,15 +588,19 @@ def execute_module(module_name: str, method_name: str | None = None, args: list
         python_command_args = args
         python_mode = "-m"
 
-    logger.debug(f"execute_module - Executing {python_command}")
-    # Execute the command as a subprocess
+    logger.debug("execute_module - Executing %s", python_command)
+    # Execute the command as a subprocess; sys.executable skips the PATH
+    # lookup and guarantees the child runs under the same interpreter
     try:
-        result = subprocess.run(['python', python_mode, python_command, *python_command_args],
-                                capture_output=True, text=True, check=False, shell=False, timeout=120)
+        result = subprocess.run([sys.executable, python_mode, python_command, *python_command_args],
+                                capture_output=True, text=True, check=False, shell=False, timeout=120,
+                                **_POPEN_EXTRA_KWARGS)
         if result.returncode == 0:
             logger.debug(
                 f"execute_module -Execution returned 0 exit code")
             if method_name:
+                if cache_key is not None:
+                    _tool_cache_set(cache_key, result.stdout)
                 return result.stdout
             else:
                 return result.stdout.strip()
@@ -394,7 +643,17 @@ def execute_command(command_name: str, args: list = [], asynchronous: bool = Fal
         >>> agent.execute_command('ls', args=['non-exist.dir'])
         "execute_command returned non-0 return code. Output:, Error: ls: cannot access 'non-exist.dir': No such file or directory\\n"
     """
-    import json
+    cache_key = None
+    if not asynchronous and command_name in _PURE_COMMANDS:
+        try:
+            cache_key = ('execute_command', command_name, tuple(args))
+            hash(cache_key)
+        except TypeError:
+            cache_key = None  # unhashable argument, skip caching
+        if cache_key is not None and (cached := _tool_cache_get(cache_key)) is not None:
+            logger.debug(
+                f"execute_command - serving {command_name} from tool cache")
+            return cached
     # Execute the command as a subprocess
     try:
         if asynchronous:
@@ -402,18 +661,23 @@ def execute_command(command_name: str, args: list = [], asynchronous: bool = Fal
                                        stdout=subprocess.PIPE,
                                        stderr=subprocess.PIPE,
                                        text=True,
-                                       shell=False)
+                                       shell=False,
+                                       **_POPEN_EXTRA_KWARGS)
             logger.debug(
                 f"execute_command - started parallel process: {process.pid}")
             return f"started {command_name} in a parallel process: {process.pid}"
         else:
             result = subprocess.run([command_name, *args],
-                                    capture_output=True, text=True, check=False, shell=False, timeout=120)
+                                    capture_output=True, text=True, check=False, shell=False, timeout=120,
+                                    **_POPEN_EXTRA_KWARGS)
             logger.debug(
                 f"execute_command -returned {result.stdout}.")
             output = {'output': result.stdout}
             if result.returncode == 0:
-                return json.dumps(output)
+                reply = json.dumps(output)
+                if cache_key is not None:
+                    _tool_cache_set(cache_key, reply)
+                return reply
             else:
                 logger.error(
                     f"execute_command -Execution returned non-0 exit code. Error: {result.stderr}")
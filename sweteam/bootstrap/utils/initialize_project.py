@@ -1,16 +1,37 @@
+import json
 import os
+
+try:
+    # orjson parses small config files several times faster than the stdlib
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 from .log import get_logger
 
 logger = get_logger(__package__ or __name__)
 
+# parsed agent configs keyed by path and guarded by mtime, so repeated
+# initialization runs skip the disk read unless the file actually changed
+_agent_config_cache: dict[str, tuple[float, dict]] = {}
+
+
+def _load_agent_config(config_json: str) -> dict:
+    mtime = os.path.getmtime(config_json)
+    cached = _agent_config_cache.get(config_json)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(config_json, "rb") as f:
+        agent_config = _json_loads(f.read())
+    _agent_config_cache[config_json] = (mtime, agent_config)
+    return agent_config
+
 
 def initialize_agent_files(agent_parent_dir: str | None = None) -> str:
     """Initialize the agent files
     """
     logger.debug(
         f"<Initializing> - updating agents instructions as part of project setup. Should not be used in production")
-    import os
-    import json
     from ..defs.agent_defs import new_instructions
 
     agents_dir = os.path.join(
@@ -21,13 +42,14 @@ def initialize_agent_files(agent_parent_dir: str | None = None) -> str:
     for agent_name in agents_list:
         config_json = os.path.join(agents_dir, f"{agent_name}.json")
         if new_instructions.get(agent_name):
-            with open(config_json, "r") as f:
-                agent_config = json.load(f)
+            agent_config = _load_agent_config(config_json)
 
             agent_config["instruction"] = new_instructions[agent_name] + \
                 new_instructions["all"]
             with open(config_json, "w") as f:
                 json.dump(agent_config, f, indent=4)
+            # the file just changed on disk; let the next load re-read it
+            _agent_config_cache.pop(config_json, None)
     logger.info(
         f"<Initializing> - updated {len(agents_list)} agents instructions")
     return 'done.'
@@ -4,6 +4,7 @@ from llama_index.llms.ollama import Ollama
 from llama_index.embeddings import OllamaEmbedding
 from ..config import config
 from .log import get_logger
+from .response_cache import ResponseCache
 
 ollama_embedding = OllamaEmbedding(
     model_name="llama3.2",
@@ -36,17 +37,29 @@ class IssueVectorStore():
             issue_dir, recursive=True).load_data()
 
         self.index = VectorStoreIndex.from_documents(documents)
+        # repeated or near-duplicate questions are answered from cache
+        # instead of re-running the embedding + retrieval + LLM pipeline
+        self._query_cache = ResponseCache()
 
         self.logger.debug(f"initialized Issue Index Vector Store...")
 
     def query(self, question: str) -> str:
         """query the index about the content indexed"""
+        cached = self._query_cache.get(
+            self.__class__.__name__, "issue_index", question)
+        if cached is not None:
+            self.logger.debug(f"answered query '{question}' from cache")
+            return cached
+
         query_engine = self.index.as_query_engine()
 
         response = query_engine.query(question)
 
         self.logger.debug(f"answered query '{question}'")
-        return response
+        answer = str(response)
+        self._query_cache.set(
+            self.__class__.__name__, "issue_index", question, answer)
+        return answer
 
     def refresh(self) -> str:
         # Load the updated documents
@@ -55,6 +68,8 @@ class IssueVectorStore():
 
         # Refresh the index
         refreshed_docs = self.index.refresh_ref_docs(updated_documents)
+        # cached answers may describe pre-refresh content, start over
+        self._query_cache = ResponseCache()
 
         self.logger.debug(
             f"updated the Issue Index Vector Store with {refreshed_docs}")
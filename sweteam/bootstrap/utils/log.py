@@ -1,16 +1,39 @@
 """code setting up logger using context manager"""
 
+import functools
 import logging
 import logging.handlers
 from contextlib import contextmanager
 from typing import Generator
 import os
 
+LOG_LEVEL = {
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "CRITICAL": logging.CRITICAL
+}
 
+# formatters hold no per-logger state, so one instance of each is shared
+# by every handler instead of being rebuilt per get_logger call
+_CONSOLE_FORMATTER = logging.Formatter("#%(levelname)9s - %(name)s - %(filename)s:%(lineno)d"
+                                       " %(funcName)s() - %(message)s")
+_FILE_FORMATTER = logging.Formatter("%(asctime)s %(levelname)s - %(name)s "
+                                    "- %(filename)s:%(lineno)d  "
+                                    "%(module)s.%(funcName)s() - %(message)s")
+
+
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str, stream: str | bool = 'INFO', file: str | bool = '',
                *, log_file: str = '', level: str = 'DEBUG') -> logging.Logger:
     """configure a logger with multiple handlers
 
+    Called from every constructor, so the result is memoized: repeated
+    calls with the same arguments return the already configured logger
+    without re-scanning its handlers (logging.getLogger is process-global
+    anyway, so this changes no behavior).
+
     Args:
         name: the name of the logger that will be shown in the logs
         stream: set stream log level, default is 'INFO'
@@ -20,40 +43,36 @@ def get_logger(name: str, stream: str | bool = 'INFO', file: str | bool = '',
     Yields:
         logger: the logger object with name and handler set up
     """
-    LOG_LEVEL = {
-        "INFO": logging.INFO,
-        "DEBUG": logging.DEBUG,
-        "ERROR": logging.ERROR,
-        "WARNING": logging.WARNING,
-        "CRITICAL": logging.CRITICAL
-    }
     logger_ = logging.getLogger(name)
     logger_.setLevel(LOG_LEVEL[level] if level in LOG_LEVEL else logging.DEBUG)
 
-    console_handler = logging.StreamHandler()
-    if stream in LOG_LEVEL and (console_handler.__class__ not in
-                                {h.__class__ for h in logger_.handlers}):
+    # handler classes already attached, remembered on the logger itself so
+    # repeat configuration calls test membership instead of rescanning
+    present = getattr(logger_, "_handler_classes", None)
+    if present is None:
+        present = {h.__class__ for h in logger_.handlers}
+        logger_._handler_classes = present
+
+    if stream in LOG_LEVEL and logging.StreamHandler not in present:
+        console_handler = logging.StreamHandler()
         console_handler.setLevel(LOG_LEVEL[stream])
-        c_format = logging.Formatter("#%(levelname)9s - %(name)s - %(filename)s:%(lineno)d"
-                                     " %(funcName)s() - %(message)s")
-        console_handler.setFormatter(c_format)
+        console_handler.setFormatter(_CONSOLE_FORMATTER)
         logger_.addHandler(console_handler)
+        present.add(logging.StreamHandler)
 
     log_file = log_file or f"{__file__[:-3]}.log"
     file_handler_class = logging.handlers.RotatingFileHandler
     if file in LOG_LEVEL:
-        if (file_handler_class in {h.__class__ for h in logger_.handlers}):
+        if file_handler_class in present:
             logger_.warning("Setting logging-to-file to level %s but Logger %s already has a file handler,"
                             " skipping...", file, name)
         else:
             file_handler = file_handler_class(
                 log_file, maxBytes=10485760, backupCount=9, encoding='utf-8')
             file_handler.setLevel(LOG_LEVEL[file])
-            f_format = logging.Formatter("%(asctime)s %(levelname)s - %(name)s "
-                                        "- %(filename)s:%(lineno)d  "
-                                        "%(module)s.%(funcName)s() - %(message)s")
-            file_handler.setFormatter(f_format)
+            file_handler.setFormatter(_FILE_FORMATTER)
             logger_.addHandler(file_handler)
+            present.add(file_handler_class)
 
     if not logger_.hasHandlers():
         logger_.addHandler(logging.NullHandler())
@@ -0,0 +1,85 @@
+"""A small semantic cache for agent replies.
+
+Exact repeats are served from an in-process dict without touching the LLM
+API at all; when an embedding function is available (Ollama by default),
+near-duplicate prompts are served by cosine similarity against the stored
+task vectors.
+"""
+import hashlib
+import math
+from ..config import config
+from .log import get_logger
+
+
+class ResponseCache:
+    """cache agent replies keyed by (agent name, instruction hash, task)
+
+    The instruction is hashed into the key so a cached reply is never
+    served to an agent whose instructions have changed since it was stored.
+    """
+
+    def __init__(self, embed=None, similarity_threshold: float = 0.95) -> None:
+        self.logger = get_logger(self.__class__.__name__)
+        self.similarity_threshold = similarity_threshold
+        self._exact: dict[tuple, str] = {}
+        self._vectors: list[tuple[tuple, list[float], str]] = []
+        self._embed = embed if embed is not None else self._ollama_embed
+        self._embed_client = None
+
+    @staticmethod
+    def make_key(agent_name: str, instruction: str, task: str) -> tuple:
+        instruction_hash = hashlib.blake2b(instruction.encode()).hexdigest()
+        return (agent_name, instruction_hash, task)
+
+    def _ollama_embed(self, text: str) -> list[float] | None:
+        """embed text via Ollama; None disables the similarity fallback"""
+        try:
+            if self._embed_client is None:
+                import ollama
+                self._embed_client = ollama.Client(host=config.OLLAMA_HOST)
+            response = self._embed_client.embeddings(
+                model=config.OLLAMA_DEFAULT_BASE_MODEL, prompt=text)
+            return list(response["embedding"])
+        except Exception as e:
+            self.logger.debug(
+                "embedding unavailable, falling back to exact match only: %s", e)
+            return None
+
+    @staticmethod
+    def _normalize(vector: list[float]) -> list[float] | None:
+        """scale to unit length so cosine similarity against any stored
+        vector reduces to a single dot product, instead of recomputing
+        both norms on every comparison"""
+        norm = math.sqrt(sum(x * x for x in vector))
+        return [x / norm for x in vector] if norm else None
+
+    def get(self, agent_name: str, instruction: str, task: str) -> str | None:
+        """return a cached reply for this task, or None on a miss"""
+        key = self.make_key(agent_name, instruction, task)
+        if (reply := self._exact.get(key)) is not None:
+            self.logger.debug("exact cache hit for %s", agent_name)
+            return reply
+        if not self._vectors:
+            return None
+        vector = self._embed(task)
+        vector = self._normalize(vector) if vector is not None else None
+        if vector is None:
+            return None
+        for cached_key, cached_vector, reply in self._vectors:
+            if cached_key[:2] != key[:2]:
+                continue
+            similarity = sum(x * y for x, y in zip(vector, cached_vector))
+            if similarity >= self.similarity_threshold:
+                self.logger.debug("similarity cache hit (%.3f) for %s",
+                                  similarity, agent_name)
+                return reply
+        return None
+
+    def set(self, agent_name: str, instruction: str, task: str, reply: str) -> None:
+        """store a reply so later identical or near-identical tasks hit"""
+        key = self.make_key(agent_name, instruction, task)
+        self._exact[key] = reply
+        vector = self._embed(task)
+        vector = self._normalize(vector) if vector is not None else None
+        if vector is not None:
+            self._vectors.append((key, vector, reply))